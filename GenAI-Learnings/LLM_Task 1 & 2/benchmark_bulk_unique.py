@@ -0,0 +1,84 @@
+"""Throughput benchmark: list-based find_unique_number vs find_unique_number_bulk.
+
+Writes a shuffled binary file of little-endian int64 pairs plus one unique
+value, then times the original Python loop (on a prefix that fits in a list)
+and the bulk variant on an in-memory array, a memory-mapped file, a process
+pool and in validating mode.
+
+    python benchmark_bulk_unique.py --values 50000000 --processes 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from bulk_unique import find_unique_number_bulk, open_integers
+
+
+def find_unique_number(nums):
+    """The original Task 1 function."""
+    unique = 0
+    for num in nums:
+        unique ^= num
+    return unique
+
+
+def build_file(path, values, seed=42):
+    rng = np.random.default_rng(seed)
+    pairs = rng.integers(np.iinfo(np.int64).min, np.iinfo(np.int64).max, size=values // 2, dtype=np.int64)
+    unique = int(pairs[-1])
+    data = np.concatenate((pairs[:-1], pairs[:-1], pairs[-1:]))
+    rng.shuffle(data)
+    data.astype("<i8").tofile(path)
+    return unique
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=50_000_000)
+    parser.add_argument("--python-values", type=int, default=5_000_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "values.bin")
+        unique = build_file(path, args.values)
+        n = len(open_integers(path))
+
+        prefix = open_integers(path)[:args.python_values].tolist()
+        python_result, python_seconds = timed(find_unique_number, prefix)
+        assert python_result == int(np.bitwise_xor.reduce(np.array(prefix, dtype=np.int64)))
+
+        in_memory = np.fromfile(path, dtype="<i8")
+        bulk_runs = [
+            ("Bulk, in-memory array", timed(find_unique_number_bulk, in_memory)),
+            ("Bulk, memory-mapped file", timed(find_unique_number_bulk, path)),
+            (f"Bulk, {args.processes} processes", timed(find_unique_number_bulk, path, processes=args.processes)),
+        ]
+        del in_memory
+        report, validate_seconds = timed(find_unique_number_bulk, path, validate=True, processes=args.processes)
+
+    for label, (result, _) in bulk_runs:
+        assert result == unique, label
+    assert report.ok and report.value == unique, report.reason
+
+    rows = [("Python loop (prefix)", len(prefix), python_seconds)]
+    rows += [(label, n, seconds) for label, (_, seconds) in bulk_runs]
+    rows.append(("Validating, bucketed counts", n, validate_seconds))
+
+    print(f"Values: {n:,} ({n * 8 / 1e6:,.0f} MB)")
+    for label, count, seconds in rows:
+        print(f"{label + ':':32} {seconds:8.3f}s  {count / seconds:>16,.0f} values/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Throughput benchmark: one object per account vs the array-backed Ledger.
+
+    python benchmark_ledger.py --accounts 1000000 --transactions 2000000 --batch 100000 --threads 4
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ledger import APPLIED, INVALID_AMOUNT, NON_INTEGRAL_AMOUNT, Ledger
+
+
+class ObjectAccount:
+    """The original Task 2 BankAccount logic without the prints."""
+
+    def __init__(self, initial_balance):
+        self.__balance = initial_balance
+
+    def deposit(self, amount):
+        if amount > 0:
+            self.__balance += amount
+
+    def withdraw(self, amount):
+        if 0 < amount <= self.__balance:
+            self.__balance -= amount
+
+    def get_balance(self):
+        return self.__balance
+
+
+def check_amount_handling():
+    """
+    Integer ledgers reject fractional amounts instead of truncating them, and an
+    object-dtype ledger (what BankAccount uses) matches the original arithmetic.
+    """
+    ledger = Ledger(1, 1000)
+    assert ledger.deposit(0, 10.5).status == NON_INTEGRAL_AMOUNT
+    assert ledger.withdraw(0, 0.5).status == NON_INTEGRAL_AMOUNT
+    assert ledger.deposit(0, 10.0).status == APPLIED
+    result = ledger.apply_batch([0, 0, 0, 0], [0.5, 10.7, -0.5, 2**70], [False, False, True, False])
+    assert result.status.tolist() == [NON_INTEGRAL_AMOUNT, NON_INTEGRAL_AMOUNT, INVALID_AMOUNT, NON_INTEGRAL_AMOUNT]
+    assert ledger.balance(0) == 1010
+
+    # Same ledger a standalone BankAccount builds; deposit(10.5) then withdraw(0.5)
+    # on 1000 must give 1010.0, and 10**20 balances must not overflow.
+    operations = [(10.5, False), (0.5, True), (2000, True), (-1, False), (10**20, False), (10**20, True)]
+    for initial_balance in (1000, 1000.25, 10**20):
+        reference = ObjectAccount(initial_balance)
+        exact = Ledger(1, initial_balance, dtype=object, stripes=1)
+        for amount, withdrawal in operations:
+            if withdrawal:
+                reference.withdraw(amount)
+                exact.withdraw(0, amount)
+            else:
+                reference.deposit(amount)
+                exact.deposit(0, amount)
+            assert exact.balance(0) == reference.get_balance(), (initial_balance, amount)
+            assert type(exact.balance(0)) is type(reference.get_balance())
+
+    exact = Ledger(1, 1000, dtype=object, stripes=1)
+    exact.deposit(0, 10.5)
+    exact.withdraw(0, 0.5)
+    assert exact.balance(0) == 1010.0
+
+
+def make_transactions(accounts, transactions, seed=42):
+    rng = np.random.default_rng(seed)
+    ids = rng.integers(0, accounts, size=transactions)
+    amounts = rng.integers(1, 1500, size=transactions)
+    withdrawals = rng.random(transactions) < 0.5
+    return ids, amounts, withdrawals
+
+
+def run_objects(accounts, initial_balance, ids, amounts, withdrawals):
+    book = [ObjectAccount(initial_balance) for _ in range(accounts)]
+    started = time.perf_counter()
+    for account_id, amount, withdrawal in zip(ids.tolist(), amounts.tolist(), withdrawals.tolist()):
+        if withdrawal:
+            book[account_id].withdraw(amount)
+        else:
+            book[account_id].deposit(amount)
+    return time.perf_counter() - started, np.array([a.get_balance() for a in book])
+
+
+def run_ledger(accounts, initial_balance, ids, amounts, withdrawals, batch, threads, partitioned=False):
+    """
+    Applies the transactions in batches. With partitioned=True, thread t only
+    gets accounts with id % threads == t, so threads touch disjoint lock
+    stripes and per-account order matches the sequential run.
+    """
+    ledger = Ledger(accounts, initial_balance)
+    streams = [(ids, amounts, withdrawals)]
+    if partitioned:
+        streams = [
+            (ids[mask], amounts[mask], withdrawals[mask])
+            for mask in (ids % threads == t for t in range(threads))
+        ]
+
+    def apply_stream(stream):
+        stream_ids, stream_amounts, stream_withdrawals = stream
+        for i in range(0, len(stream_ids), batch):
+            ledger.apply_batch(stream_ids[i:i + batch], stream_amounts[i:i + batch], stream_withdrawals[i:i + batch])
+
+    started = time.perf_counter()
+    if partitioned:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(apply_stream, streams))
+    elif threads == 1:
+        apply_stream(streams[0])
+    else:
+        batches = [
+            (ids[i:i + batch], amounts[i:i + batch], withdrawals[i:i + batch])
+            for i in range(0, len(ids), batch)
+        ]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda batch_args: ledger.apply_batch(*batch_args), batches))
+    return time.perf_counter() - started, ledger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=1_000_000)
+    parser.add_argument("--transactions", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--initial-balance", type=int, default=1000)
+    args = parser.parse_args()
+
+    check_amount_handling()
+    ids, amounts, withdrawals = make_transactions(args.accounts, args.transactions)
+
+    object_seconds, object_balances = run_objects(args.accounts, args.initial_balance, ids, amounts, withdrawals)
+    ledger_seconds, ledger = run_ledger(
+        args.accounts, args.initial_balance, ids, amounts, withdrawals, args.batch, threads=1
+    )
+    assert np.array_equal(object_balances, ledger.balances()), "ledger diverged from per-object accounts"
+
+    threaded_seconds, threaded = run_ledger(
+        args.accounts, args.initial_balance, ids, amounts, withdrawals, args.batch, args.threads
+    )
+    assert np.all(threaded.balances() >= 0)
+
+    partitioned_seconds, partitioned = run_ledger(
+        args.accounts, args.initial_balance, ids, amounts, withdrawals, args.batch, args.threads, partitioned=True
+    )
+    assert np.array_equal(object_balances, partitioned.balances()), "partitioned run diverged"
+
+    n = args.transactions
+    print(f"Accounts: {args.accounts:,}  Transactions: {n:,}  Batch: {args.batch:,}")
+    print(f"Object per account (sequential):  {object_seconds:7.3f}s  {n / object_seconds:>14,.0f} tx/s")
+    print(f"Ledger, 1 thread:                 {ledger_seconds:7.3f}s  {n / ledger_seconds:>14,.0f} tx/s")
+    print(f"Ledger, {args.threads} threads (shared):      {threaded_seconds:7.3f}s  {n / threaded_seconds:>14,.0f} tx/s")
+    print(f"Ledger, {args.threads} threads (partitioned): {partitioned_seconds:7.3f}s  {n / partitioned_seconds:>14,.0f} tx/s")
+
+
+if __name__ == "__main__":
+    main()
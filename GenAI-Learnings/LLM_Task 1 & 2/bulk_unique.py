@@ -0,0 +1,243 @@
+"""Bulk find_unique_number for large arrays and binary integer files.
+
+The Task 1 find_unique_number XORs a Python list one element at a time. This
+version takes a NumPy array, a np.memmap or the path of a raw binary file of
+fixed-width integers (e.g. little-endian int64) and:
+
+* XOR-reduces it in fixed-size chunks with np.bitwise_xor.reduce, so memory
+  stays constant however large the file is,
+* optionally splits the file into contiguous spans across a process pool,
+  each worker memory-maps its own span and the per-span results are XORed,
+* in validating mode, checks the "every value appears twice except one"
+  precondition, which XOR alone cannot detect.
+
+Example:
+
+    find_unique_number_bulk("reconciliation.bin", dtype="<i8")
+    find_unique_number_bulk("reconciliation.bin", dtype="<i8", processes=8)
+    report = find_unique_number_bulk("reconciliation.bin", dtype="<i8", validate=True)
+    report.ok, report.value, report.violations
+
+Validation counts every value exactly. One pass hashes every value into
+ceil(n / validate_bucket_size) buckets and appends it to that bucket's temp
+file (all copies of a value land in the same file), then each bucket file is
+counted on its own, optionally in the process pool. Total I/O is linear in n,
+at the cost of a temporary copy of the data on disk (in validate_tmpdir).
+A bucket buffers at most about validate_bucket_size raw values before
+collapsing them into a (value, count) table, so memory grows with the distinct
+values per bucket, not with occurrences: a zero-padded or sentinel-filled dump
+collapses to one entry.
+"""
+
+import math
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 22
+DEFAULT_VALIDATE_BUCKET_SIZE = 1 << 24
+MAX_VIOLATIONS = 10
+
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+@dataclass(frozen=True)
+class UniqueNumberReport:
+    """
+    Result of a validating run. `value` is the XOR of all values; it is only
+    the unique number when `ok` is True. `violations` holds up to
+    MAX_VIOLATIONS (value, count) pairs whose count is neither 1 nor 2.
+    """
+
+    value: int
+    total: int
+    distinct: int
+    singles: int
+    violations: list
+
+    @property
+    def ok(self) -> bool:
+        return self.singles == 1 and not self.violations
+
+    @property
+    def reason(self) -> str:
+        if self.ok:
+            return "exactly one unique value"
+        if self.violations:
+            value, count = self.violations[0]
+            return f"value {value} appears {count} times"
+        return f"{self.singles} values appear once, expected exactly 1"
+
+
+def _integer_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu":
+        raise ValueError(f"Expected a fixed-width integer dtype, got {dtype}")
+    return dtype
+
+
+def open_integers(path: str, dtype="<i8", offset: int = 0) -> np.ndarray:
+    """Read-only memory map of a raw binary file of fixed-width integers."""
+    dtype = _integer_dtype(dtype)
+    size = os.path.getsize(path) - offset
+    if size % dtype.itemsize:
+        raise ValueError(f"{path}: {size} bytes is not a multiple of the {dtype} item size")
+    if size == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset)
+
+
+def _chunks(values: np.ndarray, chunk_size: int):
+    for start in range(0, len(values), chunk_size):
+        yield values[start:start + chunk_size]
+
+
+def xor_reduce(values: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """XOR of all values, reduced one chunk at a time."""
+    result = values.dtype.type(0)
+    for chunk in _chunks(values, chunk_size):
+        result ^= np.bitwise_xor.reduce(chunk)
+    return int(result)
+
+
+def _xor_span(path: str, dtype: str, offset: int, start: int, stop: int, chunk_size: int) -> int:
+    return xor_reduce(open_integers(path, dtype, offset)[start:stop], chunk_size)
+
+
+def _source(source, dtype, offset: int):
+    """(values, path, offset) for an array, a memmap or a file path."""
+    if isinstance(source, (str, os.PathLike)):
+        return open_integers(source, dtype, offset), os.fspath(source), offset
+    values = np.asarray(source)
+    _integer_dtype(values.dtype)
+    if isinstance(source, np.memmap) and isinstance(source.base, mmap.mmap) and source.ndim == 1:
+        return values, source.filename, source.offset
+    return values.ravel(), None, None
+
+
+def _bucket_of(values: np.ndarray, buckets: int) -> np.ndarray:
+    hashed = values.astype(np.uint64, copy=False) * _HASH_MULTIPLIER
+    return (hashed >> np.uint64(32)) % np.uint64(buckets)
+
+
+def _collapse(table, pending):
+    """Merges a sorted (value, count) table with a list of raw value arrays."""
+    unique, counts = np.unique(np.concatenate(pending), return_counts=True)
+    if len(table[0]) == 0:
+        return unique, counts
+    merged, inverse = np.unique(np.concatenate((table[0], unique)), return_inverse=True)
+    weights = np.concatenate((table[1], counts))
+    return merged, np.bincount(inverse.ravel(), weights=weights, minlength=len(merged)).astype(np.int64)
+
+
+def _count_values(values: np.ndarray, chunk_size: int, budget: int):
+    """
+    (distinct, singles, violations) for one bucket's values. Raw values are
+    buffered up to `budget` and then collapsed into a sorted (value, count)
+    table, so memory is bounded by budget + distinct values.
+    """
+    table = (values[:0].copy(), np.zeros(0, dtype=np.int64))
+    pending, pending_size = [], 0
+    for chunk in _chunks(values, chunk_size):
+        pending.append(np.array(chunk))
+        pending_size += len(chunk)
+        if pending_size >= max(budget, len(table[0])):
+            table, pending, pending_size = _collapse(table, pending), [], 0
+    unique, counts = _collapse(table, pending) if pending else table
+    bad = np.flatnonzero(counts > 2)[:MAX_VIOLATIONS]
+    violations = list(zip(unique[bad].tolist(), counts[bad].tolist()))
+    return len(unique), int(np.count_nonzero(counts == 1)), violations
+
+
+def _count_bucket_file(path: str, dtype: str, chunk_size: int, budget: int):
+    return _count_values(open_integers(path, dtype), chunk_size, budget)
+
+
+def _partition(values: np.ndarray, buckets: int, directory: str, chunk_size: int) -> list:
+    """Single pass that appends every value to its bucket's file; returns the file paths."""
+    paths = [os.path.join(directory, f"bucket-{bucket:05d}.bin") for bucket in range(buckets)]
+    files = [open(path, "wb") for path in paths]
+    try:
+        for chunk in _chunks(values, chunk_size):
+            bucket_of = _bucket_of(chunk, buckets)
+            order = np.argsort(bucket_of, kind="stable")
+            bounds = np.cumsum(np.bincount(bucket_of, minlength=buckets))
+            for bucket, part in enumerate(np.split(chunk[order], bounds[:-1])):
+                if len(part):
+                    part.tofile(files[bucket])
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _validate(values, xor_value, chunk_size, bucket_size, processes, tmpdir) -> UniqueNumberReport:
+    buckets = max(1, math.ceil(len(values) / bucket_size))
+    if buckets == 1:
+        results = [_count_values(values, chunk_size, bucket_size)]
+    else:
+        dtype = values.dtype.str
+        with tempfile.TemporaryDirectory(prefix="bulk_unique-", dir=tmpdir) as directory:
+            paths = _partition(values, buckets, directory, chunk_size)
+            if processes and processes > 1:
+                with ProcessPoolExecutor(max_workers=processes) as pool:
+                    results = list(pool.map(
+                        _count_bucket_file,
+                        paths, [dtype] * buckets, [chunk_size] * buckets, [bucket_size] * buckets,
+                    ))
+            else:
+                results = [_count_bucket_file(path, dtype, chunk_size, bucket_size) for path in paths]
+
+    violations = sorted(v for _, _, bucket_violations in results for v in bucket_violations)
+    return UniqueNumberReport(
+        value=xor_value,
+        total=len(values),
+        distinct=sum(distinct for distinct, _, _ in results),
+        singles=sum(singles for _, singles, _ in results),
+        violations=violations[:MAX_VIOLATIONS],
+    )
+
+
+def find_unique_number_bulk(
+    source,
+    dtype="<i8",
+    offset: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: int | None = None,
+    validate: bool = False,
+    validate_bucket_size: int = DEFAULT_VALIDATE_BUCKET_SIZE,
+    validate_tmpdir: str | None = None,
+):
+    """
+    The value that appears once when every other value appears twice.
+
+    `source` is an integer array, a np.memmap or a path to a raw binary file
+    of `dtype` integers starting at byte `offset` (`dtype` and `offset` are
+    ignored for arrays). With `processes`, file-backed sources are split
+    across a process pool; in-memory arrays are always reduced in-process.
+    Returns an int, or a UniqueNumberReport when `validate` is True;
+    validation spills a copy of the values to `validate_tmpdir` (default: the
+    system temp directory) when they exceed `validate_bucket_size`.
+    """
+    values, path, offset = _source(source, dtype, offset)
+
+    if path is not None and processes and processes > 1 and len(values) > chunk_size:
+        bounds = [len(values) * i // processes for i in range(processes + 1)]
+        dtype = values.dtype.str
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            spans = pool.map(
+                _xor_span,
+                [path] * processes, [dtype] * processes, [offset] * processes,
+                bounds[:-1], bounds[1:], [chunk_size] * processes,
+            )
+            xor_value = int(np.bitwise_xor.reduce(np.array(list(spans), dtype=values.dtype)))
+    else:
+        xor_value = xor_reduce(values, chunk_size)
+
+    if not validate:
+        return xor_value
+    return _validate(values, xor_value, chunk_size, validate_bucket_size, processes, validate_tmpdir)
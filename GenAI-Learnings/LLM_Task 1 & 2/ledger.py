@@ -0,0 +1,251 @@
+"""Array-backed, thread-safe ledger behind the Task 2 BankAccount.
+
+Balances for every account live in one NumPy array instead of one Python
+object per account. Deposits and withdrawals are applied in batches:
+
+* the sufficient-funds check is vectorized: transactions are grouped by
+  account, running balances are computed with a cumulative sum, and only
+  accounts whose running balance would go negative are replayed one
+  transaction at a time (so a rejected withdrawal does not affect later ones),
+* concurrency uses lock striping: account i is guarded by lock i % stripes,
+  and a batch takes the stripes it touches in ascending order,
+* results are structured (status codes and balances), nothing is printed.
+
+Example:
+
+    ledger = Ledger(1_000_000, initial_balance=1000)
+    result = ledger.apply_batch(account_ids, amounts, withdrawals)
+    result.applied, result.status, result.balance_after
+
+Integer balances (e.g. cents) are recommended. Integer ledgers never cast an
+amount silently: amounts that are not whole numbers in the dtype's range are
+rejected with NON_INTEGRAL_AMOUNT. Float ledgers work but the batched
+running-balance check is subject to float rounding, and dtype=object keeps
+plain Python arithmetic (mixed int/float, arbitrarily large ints) at the cost
+of speed.
+"""
+
+import threading
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+import numpy as np
+
+APPLIED = 0
+INSUFFICIENT_FUNDS = 1
+INVALID_AMOUNT = 2
+UNKNOWN_ACCOUNT = 3
+NON_INTEGRAL_AMOUNT = 4
+
+STATUS_NAMES = {
+    APPLIED: "applied",
+    INSUFFICIENT_FUNDS: "insufficient funds",
+    INVALID_AMOUNT: "amount must be positive",
+    UNKNOWN_ACCOUNT: "unknown account",
+    NON_INTEGRAL_AMOUNT: "amount must be a whole number within the ledger's range",
+}
+
+DEFAULT_STRIPES = 64
+REPLAY_PASSES = 8
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _whole_amounts(amounts: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Mask of amounts an integer ledger can store exactly."""
+    if amounts.dtype.kind == "b" or (amounts.dtype.kind in "iu" and np.can_cast(amounts.dtype, dtype)):
+        return np.ones(amounts.shape, dtype=bool)
+    info = np.iinfo(dtype)
+    as_float = amounts.astype(np.float64)
+    with np.errstate(invalid="ignore"):
+        return (as_float == np.trunc(as_float)) & (as_float >= info.min) & (as_float < float(info.max) + 1)
+
+
+def _running_balances(opening, deltas, group, starts):
+    """Balance after each transaction, with the cumulative sum restarted per account group."""
+    running = np.cumsum(deltas)
+    return opening[group] + running - (running - deltas)[starts][group]
+
+
+@dataclass(frozen=True)
+class TransactionResult:
+    status: int
+    balance: object
+
+    @property
+    def ok(self) -> bool:
+        return self.status == APPLIED
+
+    @property
+    def reason(self) -> str:
+        return STATUS_NAMES[self.status]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Per-transaction status codes and the account balance right after each
+    transaction (unchanged for insufficient funds, 0 for invalid transactions).
+    """
+
+    status: np.ndarray
+    balance_after: np.ndarray
+
+    @property
+    def applied(self) -> int:
+        return int(np.count_nonzero(self.status == APPLIED))
+
+    @property
+    def rejected(self) -> int:
+        return len(self.status) - self.applied
+
+    def counts(self) -> dict:
+        codes = np.bincount(self.status, minlength=len(STATUS_NAMES))
+        return {STATUS_NAMES[code]: int(n) for code, n in enumerate(codes)}
+
+
+class Ledger:
+    def __init__(self, num_accounts: int = 0, initial_balance=0, dtype=np.int64, stripes: int = DEFAULT_STRIPES):
+        self._balances = np.full(num_accounts, initial_balance, dtype=dtype)
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return len(self._balances)
+
+    @property
+    def dtype(self):
+        return self._balances.dtype
+
+    def _locked(self, account_ids) -> ExitStack:
+        """Acquires the stripes guarding account_ids in ascending order (deadlock-free)."""
+        stack = ExitStack()
+        touched = np.bincount(np.asarray(account_ids) % len(self._stripes), minlength=len(self._stripes))
+        for stripe in np.flatnonzero(touched):
+            stack.enter_context(self._stripes[stripe])
+        return stack
+
+    def _locked_all(self) -> ExitStack:
+        return self._locked(np.arange(len(self._stripes)))
+
+    def open_accounts(self, count: int, initial_balance=0) -> range:
+        """Appends `count` accounts and returns their IDs."""
+        with self._locked_all():
+            start = len(self._balances)
+            self._balances = np.concatenate(
+                (self._balances, np.full(count, initial_balance, dtype=self._balances.dtype))
+            )
+        return range(start, start + count)
+
+    def balance(self, account_id: int):
+        if not 0 <= account_id < len(self._balances):
+            raise KeyError(f"Unknown account: {account_id}")
+        with self._locked([account_id]):
+            return _scalar(self._balances[account_id])
+
+    def balances(self, account_ids=None) -> np.ndarray:
+        """Copy of the balances of account_ids (all accounts when omitted)."""
+        ids = np.arange(len(self._balances)) if account_ids is None else np.asarray(account_ids)
+        with self._locked(ids):
+            return self._balances[ids].copy()
+
+    def _apply_one(self, account_id: int, amount, withdrawal: bool) -> TransactionResult:
+        if not 0 <= account_id < len(self._balances):
+            return TransactionResult(UNKNOWN_ACCOUNT, None)
+        with self._locked([account_id]):
+            balance = _scalar(self._balances[account_id])
+            if not amount > 0:
+                return TransactionResult(INVALID_AMOUNT, balance)
+            if self._balances.dtype.kind in "iu":
+                if not _whole_amounts(np.asarray(amount), self._balances.dtype):
+                    return TransactionResult(NON_INTEGRAL_AMOUNT, balance)
+                amount = int(amount)
+            if withdrawal and amount > balance:
+                return TransactionResult(INSUFFICIENT_FUNDS, balance)
+            self._balances[account_id] = balance - amount if withdrawal else balance + amount
+            return TransactionResult(APPLIED, _scalar(self._balances[account_id]))
+
+    def deposit(self, account_id: int, amount) -> TransactionResult:
+        return self._apply_one(account_id, amount, withdrawal=False)
+
+    def withdraw(self, account_id: int, amount) -> TransactionResult:
+        return self._apply_one(account_id, amount, withdrawal=True)
+
+    def deposit_batch(self, account_ids, amounts) -> BatchResult:
+        return self.apply_batch(account_ids, amounts, False)
+
+    def withdraw_batch(self, account_ids, amounts) -> BatchResult:
+        return self.apply_batch(account_ids, amounts, True)
+
+    def apply_batch(self, account_ids, amounts, withdrawals) -> BatchResult:
+        """
+        Applies transactions in order. `withdrawals` is a bool (or bool array)
+        marking withdrawals; all other transactions are deposits.
+        """
+        ids = np.asarray(account_ids, dtype=np.int64)
+        raw_amounts = np.broadcast_to(np.asarray(amounts), ids.shape)
+        withdrawals = np.broadcast_to(np.asarray(withdrawals, dtype=bool), ids.shape)
+
+        status = np.full(len(ids), APPLIED, dtype=np.int8)
+        balance_after = np.zeros(len(ids), dtype=self._balances.dtype)
+        known = (ids >= 0) & (ids < len(self._balances))
+        status[~known] = UNKNOWN_ACCOUNT
+        status[known & ~(raw_amounts > 0)] = INVALID_AMOUNT
+        if self._balances.dtype.kind in "iu":
+            whole = _whole_amounts(raw_amounts, self._balances.dtype)
+            status[(status == APPLIED) & ~whole] = NON_INTEGRAL_AMOUNT
+            raw_amounts = np.where(status == APPLIED, raw_amounts, 0)
+        amounts = raw_amounts.astype(self._balances.dtype)
+
+        live = np.flatnonzero(status == APPLIED)
+        if len(live) == 0:
+            return BatchResult(status, balance_after)
+
+        order = live[np.argsort(ids[live], kind="stable")]
+        accounts = ids[order]
+        deltas = np.where(withdrawals[order], -amounts[order], amounts[order])
+
+        group_start = np.ones(len(order), dtype=bool)
+        group_start[1:] = accounts[1:] != accounts[:-1]
+        group = np.cumsum(group_start) - 1
+        starts = np.flatnonzero(group_start)
+        ends = np.append(starts[1:], len(order))
+        unique_accounts = accounts[starts]
+
+        with self._locked(unique_accounts):
+            opening = self._balances[unique_accounts]
+            running = _running_balances(opening, deltas, group, starts)
+
+            # Accounts a withdrawal would overdraw: each pass rejects the first
+            # overdrawing withdrawal per account and recomputes just those
+            # accounts; whatever is left after a few passes is replayed in order.
+            for _ in range(REPLAY_PASSES):
+                overdrawn = (running < 0) & (deltas < 0)
+                if not overdrawn.any():
+                    break
+                positions = np.flatnonzero(overdrawn)
+                first = positions[np.r_[True, group[positions[1:]] != group[positions[:-1]]]]
+                status[order[first]] = INSUFFICIENT_FUNDS
+                deltas[first] = 0
+                redo = np.isin(group, group[first])
+                redo_group = group[redo]
+                redo_start = np.r_[True, redo_group[1:] != redo_group[:-1]]
+                redo_starts = np.flatnonzero(redo_start)
+                running[redo] = _running_balances(
+                    opening[redo_group[redo_starts]], deltas[redo], np.cumsum(redo_start) - 1, redo_starts
+                )
+            else:
+                for g in np.unique(group[(running < 0) & (deltas < 0)]):
+                    balance = opening[g]
+                    for position in range(starts[g], ends[g]):
+                        if deltas[position] < 0 and balance + deltas[position] < 0:
+                            status[order[position]] = INSUFFICIENT_FUNDS
+                        else:
+                            balance += deltas[position]
+                        running[position] = balance
+
+            self._balances[unique_accounts] = running[ends - 1]
+
+        balance_after[order] = running
+        return BatchResult(status, balance_after)
@@ -24,6 +24,14 @@ def find_unique_number(nums):
 nums = [4, 1, 2, 1, 2]
 print(find_unique_number(nums))
 
+# For large NumPy arrays or binary integer files, use the chunked bulk variant;
+# validate=True also checks that exactly one value is unique.
+import numpy as np
+from bulk_unique import find_unique_number_bulk
+
+report = find_unique_number_bulk(np.array(nums), validate=True)
+print(report.value, report.reason)
+
 """# Problem 2
 
 "Task - 2 : Create a class BankAccount that allows a user to deposit, withdraw, and check the balance. Implement encapsulation so that the balance cannot be accessed directly but only through methods.
@@ -47,28 +55,49 @@ print(acc.__balance)  # This should raise an AttributeError
 "
 """
 
+from ledger import Ledger, APPLIED, INSUFFICIENT_FUNDS, NON_INTEGRAL_AMOUNT
+
 class BankAccount:
-    def __init__(self, initial_balance):
-        self.__balance = initial_balance
+    """
+    Thin view over one slot of a Ledger; the balance lives only in the ledger.
+    A standalone account uses an object-dtype ledger, so its arithmetic is plain
+    Python (10.5, 10**20, ...) exactly like the original class. Views over an
+    integer ledger reject fractional amounts instead of truncating them.
+    """
+
+    def __init__(self, initial_balance, ledger=None, account_id=None):
+        if ledger is None:
+            ledger = Ledger(1, initial_balance, dtype=object, stripes=1)
+            account_id = 0
+        self.__ledger = ledger
+        self.__account_id = account_id
+
+    @classmethod
+    def view(cls, ledger, account_id):
+        return cls(None, ledger=ledger, account_id=account_id)
 
     def deposit(self, amount):
-        if amount > 0:
-            self.__balance += amount
+        result = self.__ledger.deposit(self.__account_id, amount)
+        if result.status == APPLIED:
             print(f"Deposited: {amount}")
+        elif result.status == NON_INTEGRAL_AMOUNT:
+            print("Deposit amount must be a whole number.")
         else:
             print("Deposit amount must be positive.")
 
     def withdraw(self, amount):
-        if amount > self.__balance:
+        result = self.__ledger.withdraw(self.__account_id, amount)
+        if result.status == INSUFFICIENT_FUNDS:
             print("Insufficient funds!")
-        elif amount <= 0:
+        elif result.status == NON_INTEGRAL_AMOUNT:
+            print("Withdrawal amount must be a whole number.")
+        elif result.status != APPLIED:
             print("Withdrawal amount must be positive.")
         else:
-            self.__balance -= amount
             print(f"Withdrawn: {amount}")
 
     def get_balance(self):
-        return self.__balance
+        return self.__ledger.balance(self.__account_id)
 
 acc = BankAccount(1000)
 acc.deposit(500)
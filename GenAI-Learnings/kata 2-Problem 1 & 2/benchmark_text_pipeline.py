@@ -0,0 +1,93 @@
+"""Benchmarks text_pipeline.analyze_reviews against the original Problem 2 code.
+
+Builds a synthetic review dump by resampling the sample Customer Review CSV,
+runs both implementations, checks they agree and prints the timings.
+
+    python benchmark_text_pipeline.py --rows 1000000 --chunksize 100000
+"""
+
+import argparse
+import os
+import string
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from text_pipeline import analyze_reviews, normalize, word_counts
+
+SAMPLE_CSV = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "Customer Review - This is good. Please provide me 30 dataset rows f....csv",
+)
+
+
+def original_word_counts(path):
+    """Problem 2 as written in katas_2_problem_1_&_2.py."""
+    df = pd.read_csv(path)
+    df["Review"] = df["Review"].str.lower()
+    df["Review"] = df["Review"].str.replace(f"[{string.punctuation}]", "", regex=True)
+    df["word_count"] = df["Review"].apply(lambda x: len(x.split()))
+    return df.groupby("Sentiment")["word_count"].mean(), df
+
+
+EDGE_CASES = [
+    "a\x1cb c", "x\x1fy", "tab\tand\x0bvt", "nbsp\xa0em\u2003space", "nul\x00inside",
+    "  leading, trailing!  ", "", "caf\u00e9 na\u00efve", "\u3000ideographic\u3000space",
+]
+
+STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def check_word_counts():
+    """word_counts must equal len(text.split()) on both the ASCII and non-ASCII paths."""
+    for texts in (EDGE_CASES, [t for t in EDGE_CASES if t.isascii()]):
+        series = pd.Series(texts, dtype=object)
+        cleaned = (t.replace("\x00", " ").lower().translate(STRIP_PUNCTUATION) for t in texts)
+        expected = [len(t.split()) for t in cleaned]
+        assert word_counts(normalize(series), len(series)).tolist() == expected, texts
+
+
+def build_dataset(rows, path, seed=42):
+    sample = pd.read_csv(SAMPLE_CSV)
+    rng = np.random.default_rng(seed)
+    sample.iloc[rng.integers(0, len(sample), size=rows)].to_csv(path, index=False)
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+    check_word_counts()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "customer_review.csv")
+        build_dataset(args.rows, path)
+        size_mb = os.path.getsize(path) / 1e6
+
+        (original_means, original_df), original_seconds = timed(original_word_counts, path)
+        stats, pipeline_seconds = timed(analyze_reviews, path, chunksize=args.chunksize)
+
+    pipeline_means = stats.mean_word_count()
+    assert np.allclose(original_means.sort_index().to_numpy(), pipeline_means.to_numpy())
+    for sentiment, subset in original_df.groupby("Sentiment"):
+        expected = np.bincount(subset["word_count"].to_numpy())
+        assert np.array_equal(expected, stats.histogram(sentiment)), sentiment
+
+    print(f"Rows: {args.rows:,} ({size_mb:,.1f} MB), chunksize {args.chunksize:,}")
+    print(f"Original (read_csv + regex + lambda): {original_seconds:8.3f}s  {args.rows / original_seconds:>12,.0f} rows/s")
+    print(f"Chunked pipeline:                     {pipeline_seconds:8.3f}s  {args.rows / pipeline_seconds:>12,.0f} rows/s")
+    print(f"Speedup: {original_seconds / pipeline_seconds:.2f}x")
+    print("\nAverage Word Count by Sentiment:\n", pipeline_means)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,16 +26,17 @@ import pandas as pd
 df = pd.read_csv("lyrics_dataset.csv")
 print(df.head())
 
-import string
-df["Lyrics"] = df["Lyrics"].str.lower()
-df["Lyrics"] = df["Lyrics"].str.replace(f"[{string.punctuation}]", "", regex=True)
+from text_pipeline import preprocess
+df["Lyrics"] = preprocess(df["Lyrics"])
 
 print(df.head())
 
-import numpy as np
+# Single streaming pass over the CSV (Algorithm L reservoir sampling); only the
+# 10 selected lyrics are preprocessed. Pass shards=N to split the file across
+# processes.
+from reservoir_sampling import sample_csv
 
-np.random.seed(42)
-sample_lyrics = np.random.choice(df["Lyrics"], size=10, replace=False)
+sample_lyrics = sample_csv("lyrics_dataset.csv", k=10, seed=42, column="Lyrics")
 
 for i, lyric in enumerate(sample_lyrics, 1):
     print(f"{i}. {lyric}")
@@ -60,19 +61,23 @@ import pandas as pd
 df = pd.read_csv("customer_review.csv")
 print(df.head())
 
-import string
+from text_pipeline import normalize, split_rows, word_counts
 
-df["Review"] = df["Review"].str.lower()
-df["Review"] = df["Review"].str.replace(f"[{string.punctuation}]", "", regex=True)
+buffer = normalize(df["Review"])
+df["Review"] = split_rows(buffer, df.index)
 
 print(df.head())
 
-df["word_count"] = df["Review"].apply(lambda x: len(x.split()))
+df["word_count"] = word_counts(buffer, len(df))
 
 
 avg_word_count = df.groupby("Sentiment")["word_count"].mean()
 print("\nAverage Word Count by Sentiment:\n", avg_word_count)
 
+# For review dumps too large for memory, stream them instead:
+#   from text_pipeline import analyze_reviews
+#   avg_word_count = analyze_reviews("customer_review.csv").mean_word_count()
+
 df
 
 import matplotlib.pyplot as plt
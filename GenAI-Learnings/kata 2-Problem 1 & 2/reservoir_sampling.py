@@ -0,0 +1,190 @@
+"""Streaming, seeded reservoir sampling for the Problem 1 lyrics sample.
+
+Replaces `np.random.choice(df["Lyrics"], size=10, replace=False)`, which needs
+the whole dataset loaded and preprocessed, with a single pass over a streaming
+CSV reader:
+
+* Algorithm L (Li, 1994): after the reservoir fills, draw how many records to
+  skip, so the random number generator is called O(k log(N/k)) times,
+* O(k) memory, and only the k selected rows are preprocessed,
+* reproducible for a given seed (and shard count),
+* optional sharding of the file by byte ranges across processes, with the
+  per-shard reservoirs merged into one uniform sample.
+
+Example:
+
+    sample_lyrics = sample_csv("lyrics_dataset.csv", k=10, seed=42)
+    sample_lyrics = sample_csv("lyrics_dataset.csv", k=10, seed=42, shards=8)
+
+Shard boundaries are moved forward to the next newline outside a quoted field
+(found with one quote-parity scan over the raw bytes, much cheaper than CSV
+parsing), so multi-line quoted lyrics stay in one shard. Shards parse strictly
+and raise csv.Error rather than sample a record cut in half, e.g. when a stray
+quote appears inside an unquoted field.
+"""
+
+import csv
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import pandas as pd
+
+from text_pipeline import preprocess
+
+_EXHAUSTED = object()
+
+
+def _uniform(rng: random.Random) -> float:
+    """Uniform draw in (0, 1], safe to take the log of."""
+    return 1.0 - rng.random()
+
+
+def algorithm_l(items, k: int, rng: random.Random):
+    """
+    Uniform sample of k items from an iterable of unknown length.
+    Returns (reservoir, items_seen).
+    """
+    items = iter(items)
+    reservoir = list(islice(items, k))
+    seen = len(reservoir)
+    if seen < k or k == 0:
+        return reservoir, seen + sum(1 for _ in items)
+
+    w = math.exp(math.log(_uniform(rng)) / k)
+    while True:
+        skip = math.floor(math.log(_uniform(rng)) / math.log1p(-w))
+        skipped = sum(1 for _ in islice(items, skip))
+        seen += skipped
+        if skipped < skip:
+            return reservoir, seen
+        item = next(items, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            return reservoir, seen
+        seen += 1
+        reservoir[rng.randrange(k)] = item
+        w *= math.exp(math.log(_uniform(rng)) / k)
+
+
+def merge_reservoirs(shards: list, k: int, rng: random.Random) -> list:
+    """
+    Merges (reservoir, items_seen) pairs from disjoint shards into a uniform
+    sample of k. The number taken from each shard is a multivariate
+    hypergeometric draw over the shard sizes, then that many are sampled from
+    the shard's reservoir.
+    """
+    remaining = [seen for _, seen in shards]
+    taken = [0] * len(shards)
+    for _ in range(min(k, sum(remaining))):
+        pick = rng.randrange(sum(remaining))
+        for i, count in enumerate(remaining):
+            if pick < count:
+                taken[i] += 1
+                remaining[i] -= 1
+                break
+            pick -= count
+
+    merged = []
+    for (reservoir, _), n in zip(shards, taken):
+        merged.extend(rng.sample(reservoir, n))
+    return merged
+
+
+def _column_values(reader, column_index: int):
+    for row in reader:
+        if len(row) > column_index:
+            yield row[column_index]
+
+
+def _read_header(path: str):
+    with open(path, "rb") as f:
+        header_line = f.readline()
+    header = next(csv.reader([header_line.decode("utf-8-sig")]))
+    return header, len(header_line)
+
+
+READ_BLOCK = 1 << 24
+
+
+def _record_boundaries(path: str, start: int, targets: list) -> list:
+    """
+    Moves each target byte offset forward to the start of the next CSV record:
+    the byte after the first newline reached with an even number of quotes
+    seen since `start` (a record start). Doubled quotes count twice, so
+    escaped quotes keep the parity right.
+    """
+    boundaries = []
+    with open(path, "rb") as f:
+        f.seek(start)
+        position, quotes = start, 0
+        for target in targets:
+            if target <= position:
+                boundaries.append(position)
+                continue
+            while position < target:
+                block = f.read(min(READ_BLOCK, target - position))
+                if not block:
+                    break
+                quotes += block.count(b'"')
+                position += len(block)
+            for line in iter(f.readline, b""):
+                quotes += line.count(b'"')
+                position += len(line)
+                if quotes % 2 == 0:
+                    break
+            boundaries.append(position)
+    return boundaries
+
+
+def _lines_in_range(path: str, start: int, end: int):
+    """Decoded lines from byte `start` (a record start) up to byte `end`."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if position >= end:
+                break
+            position += len(line)
+            yield line.decode("utf-8")
+
+
+def _sample_shard(path: str, start: int, end: int, column_index: int, k: int, seed: int, shard: int):
+    rng = random.Random(f"{seed}-{shard}")
+    reader = csv.reader(_lines_in_range(path, start, end), strict=True)
+    return algorithm_l(_column_values(reader, column_index), k, rng)
+
+
+def sample_csv(
+    path: str,
+    k: int = 10,
+    seed: int = 42,
+    column: str = "Lyrics",
+    shards: int = 1,
+    processes: int | None = None,
+) -> list:
+    """Preprocessed uniform random sample of k values from one CSV column."""
+    header, header_bytes = _read_header(path)
+    column_index = header.index(column)
+    rng = random.Random(seed)
+
+    if shards <= 1:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            sample, _ = algorithm_l(_column_values(reader, column_index), k, rng)
+    else:
+        size = os.path.getsize(path)
+        targets = [header_bytes + (size - header_bytes) * i // shards for i in range(1, shards)]
+        bounds = [header_bytes, *_record_boundaries(path, header_bytes, targets), size]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(
+                _sample_shard,
+                [path] * shards, bounds[:-1], bounds[1:],
+                [column_index] * shards, [k] * shards, [seed] * shards, range(shards),
+            ))
+        sample = merge_reservoirs(results, k, rng)
+
+    rng.shuffle(sample)
+    return preprocess(pd.Series(sample, dtype=object)).tolist()
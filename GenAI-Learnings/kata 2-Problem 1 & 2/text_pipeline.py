@@ -0,0 +1,137 @@
+"""Chunked text preprocessing and sentiment word-count aggregation.
+
+Reusable version of the Problem 1 & 2 preprocessing in katas_2_problem_1_&_2.py
+for CSV dumps too large to load at once:
+
+* each chunk is joined into one NUL-separated buffer, lowercased once and has
+  punctuation removed with a precompiled translation table (no regex),
+* word counts are computed on that buffer with NumPy (no per-row lambda),
+* per-sentiment mean word count and word-count histogram are aggregated
+  incrementally across chunks.
+
+Example:
+
+    stats = analyze_reviews("customer_review.csv")
+    print(stats.mean_word_count())
+"""
+
+import string
+import sys
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNKSIZE = 100_000
+
+ROW_SEPARATOR = "\x00"
+ASCII_WHITESPACE = "".join(chr(c) for c in range(128) if chr(c).isspace())
+ASCII_PUNCTUATION = string.punctuation.encode("ascii")
+
+# Non-ASCII text: delete punctuation and fold non-ASCII whitespace (NBSP,
+# em space, ...) to a space. ASCII whitespace, including the \x1c-\x1f
+# separators that str.split() also splits on, is handled by _SPACE_BYTES,
+# so the byte-level word split below matches str.split() on both paths.
+TRANSLATION_TABLE = str.maketrans(
+    {c: None for c in string.punctuation}
+    | {
+        chr(cp): " "
+        for cp in range(sys.maxunicode + 1)
+        if chr(cp).isspace() and chr(cp) not in ASCII_WHITESPACE
+    }
+)
+
+_SPACE_BYTES = np.zeros(256, dtype=bool)
+_SPACE_BYTES[list(ASCII_WHITESPACE.encode("ascii"))] = True
+_SPACE_BYTES[0] = True
+
+
+def normalize(texts: pd.Series) -> bytes:
+    """
+    Lowercased, punctuation-free UTF-8 buffer of a whole chunk, one row per
+    NUL-separated segment. Missing values become empty rows and stray NULs in
+    the text are treated as spaces.
+    """
+    rows = texts.fillna("").astype(str).tolist()
+    joined = ROW_SEPARATOR.join(rows)
+    if joined.count(ROW_SEPARATOR) != max(len(rows) - 1, 0):
+        joined = ROW_SEPARATOR.join(row.replace(ROW_SEPARATOR, " ") for row in rows)
+    joined = joined.lower()
+
+    if joined.isascii():
+        return joined.encode("ascii").translate(None, ASCII_PUNCTUATION)
+    return joined.translate(TRANSLATION_TABLE).encode("utf-8")
+
+
+def split_rows(buffer: bytes, index=None) -> pd.Series:
+    """Turns a normalized buffer back into one string per row."""
+    return pd.Series(buffer.decode("utf-8").split(ROW_SEPARATOR), index=index, dtype=object)
+
+
+def preprocess(texts: pd.Series) -> pd.Series:
+    """Lowercases and strips punctuation, like the kata's str.lower + regex str.replace."""
+    return split_rows(normalize(texts), texts.index)
+
+
+def word_counts(buffer: bytes, rows: int) -> np.ndarray:
+    """
+    Word count per row of a normalized buffer, equal to len(text.split()).
+
+    A word starts at every non-space byte preceded by a space or row separator;
+    starts are summed per row segment with np.add.reduceat.
+    """
+    if rows == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    data = np.frombuffer(buffer + ROW_SEPARATOR.encode("ascii"), dtype=np.uint8)
+    is_space = _SPACE_BYTES[data]
+    starts = ~is_space
+    starts[1:] &= is_space[:-1]
+
+    row_offsets = np.concatenate(([0], np.flatnonzero(data == 0)[:-1] + 1))
+    return np.add.reduceat(starts.view(np.uint8), row_offsets, dtype=np.int64)
+
+
+class SentimentWordCountStats:
+    """Running per-sentiment row count, word-count sum and word-count histogram."""
+
+    def __init__(self):
+        self.rows = {}
+        self.total_words = {}
+        self.histograms = {}
+
+    def update(self, sentiments: pd.Series, counts: np.ndarray):
+        codes, labels = pd.factorize(sentiments)
+        for code, label in enumerate(labels):
+            label_counts = counts[codes == code]
+            hist = np.bincount(label_counts)
+            previous = self.histograms.get(label, np.zeros(0, dtype=np.int64))
+            if len(previous) < len(hist):
+                previous = np.pad(previous, (0, len(hist) - len(previous)))
+            previous[: len(hist)] += hist
+            self.histograms[label] = previous
+            self.rows[label] = self.rows.get(label, 0) + len(label_counts)
+            self.total_words[label] = self.total_words.get(label, 0) + int(label_counts.sum())
+
+    def mean_word_count(self) -> pd.Series:
+        return pd.Series(
+            {label: self.total_words[label] / self.rows[label] for label in sorted(self.rows)},
+            name="word_count",
+        ).rename_axis("Sentiment")
+
+    def histogram(self, sentiment: str) -> np.ndarray:
+        """histogram(s)[n] is the number of reviews with n words."""
+        return self.histograms.get(sentiment, np.zeros(0, dtype=np.int64))
+
+
+def analyze_reviews(
+    path: str,
+    text_column: str = "Review",
+    label_column: str = "Sentiment",
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> SentimentWordCountStats:
+    """Streams a review CSV and aggregates word-count statistics per sentiment."""
+    stats = SentimentWordCountStats()
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=[text_column, label_column]):
+        buffer = normalize(chunk[text_column])
+        stats.update(chunk[label_column], word_counts(buffer, len(chunk)))
+    return stats
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import os
 from langgraph.graph import StateGraph, START, END
@@ -18,15 +19,18 @@ async def load_json(file_path: str):
 
 def data_ingestion_node(state):
     """LangGraph node to load and clean portfolio and market data."""
-    result = asyncio.run(_data_ingestion_async())
+    result = asyncio.run(_data_ingestion_async(
+        state.get("portfolio_path", PORTFOLIO_PATH),
+        state.get("market_closes_path", MARKET_CLOSES_PATH),
+    ))
     state.update(result)
     print(" \n [DIA] Data ingestion completed\n")
     return state
 
-async def _data_ingestion_async():
+async def _data_ingestion_async(portfolio_path: str, market_closes_path: str):
     """Reads, cleans, and structures portfolio & market data."""
-    portfolio_data = await load_json(PORTFOLIO_PATH)
-    market_data = await load_json(MARKET_CLOSES_PATH)
+    portfolio_data = await load_json(portfolio_path)
+    market_data = await load_json(market_closes_path)
 
     clean_portfolio_data = [
         {
@@ -39,9 +43,14 @@ async def _data_ingestion_async():
         for item in portfolio_data
     ]
 
+    inputs_hash = hashlib.sha256(
+        json.dumps([portfolio_data, market_data], sort_keys=True).encode()
+    ).hexdigest()
+
     return {
         "clean_portfolio_data": clean_portfolio_data,
-        "hist_returns": market_data
+        "hist_returns": market_data,
+        "inputs_hash": inputs_hash
     }
 
 
@@ -42,6 +42,13 @@ async def formulaic_calc_agent(state:State):
 
     state["calculated_metrics"] = result
 
+    coverage = result.get("coverage", {})
+    if coverage.get("missing_assets"):
+        print(
+            f"[FCA] No historical returns for {', '.join(coverage['missing_assets'])} "
+            f"({coverage['missing_exposure_share']:.2%} of gross exposure excluded)"
+        )
+
     print("[FCA] Computation complete\n")
     return state
 
@@ -0,0 +1,45 @@
+from typing import TypedDict
+from langgraph.types import interrupt
+from run_index import PENDING_REVIEW, record_run, run_record
+
+
+class State(TypedDict, total=False):
+    desk: str
+    inputs_hash: str
+    report_id: str
+    var_threshold: float
+    timings: dict
+    calculated_metrics: dict
+    routing_decision: str
+    validation_log: str
+    review_decision: dict
+
+
+def human_review_node(state: State):
+    """
+    Pauses a BREACH run until a risk manager responds. The checkpointed state
+    is resumed by thread ID with the review decision, then goes straight to RGA.
+    """
+    print("\n[HITL] VaR breach awaiting Risk Manager review...")
+    # Index the paused run now; RGA updates the same row after resume. The node
+    # re-runs from the top on resume, which rewrites the identical pending row.
+    record_run(run_record(state, PENDING_REVIEW))
+
+    decision = interrupt({
+        "VaR_99": state["calculated_metrics"].get("VaR_99"),
+        "mcp_audit_id": state["calculated_metrics"].get("mcp_audit_id"),
+        "validation_log": state.get("validation_log"),
+    })
+
+    reviewer = decision.get("reviewer") or "Risk Manager"
+    if decision.get("approved"):
+        validation_log = f"Manually Approved by {reviewer} (VaR Breach)"
+    else:
+        validation_log = f"Rejected by {reviewer} (VaR Breach) - mitigation plan required"
+    if decision.get("notes"):
+        validation_log += f": {decision['notes']}"
+
+    state["review_decision"] = decision
+    state["validation_log"] = validation_log
+    print(f"[HITL] Decision recorded: {validation_log}")
+    return state
@@ -1,4 +1,5 @@
 import os
+import time
 from datetime import datetime
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
@@ -7,6 +8,7 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.styles import getSampleStyleSheet
 from typing import TypedDict
 from collections import defaultdict
+from run_index import OK, new_report_id, record_run, run_record
 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -15,19 +17,30 @@ os.makedirs(REPORTS_DIR, exist_ok=True)
 
 
 class State(TypedDict, total=False):
+    desk: str
+    reports_dir: str
     clean_portfolio_data: list
+    inputs_hash: str
     calculated_metrics: dict
+    var_threshold: float
     routing_decision: str
     validation_log: str
+    review_decision: dict
+    timings: dict
+    report_id: str
 
 
 def report_generation_agent(state: State):
     print("\n[RGA] Generating Risk Assessment Report...")
+    started = time.perf_counter()
 
     clean_data = state.get("clean_portfolio_data", [])
     calculated_metrics = state.get("calculated_metrics", {})
     routing_decision = state.get("routing_decision", "UNKNOWN")
     validation_log = state.get("validation_log", "N/A")
+    coverage_report = calculated_metrics.get("coverage", {})
+    review_decision = state.get("review_decision")
+    var_threshold = state.get("var_threshold", 550000.0)
 
     var_99 = calculated_metrics.get("VaR_99", 0.0)
     audit_id = calculated_metrics.get("mcp_audit_id", "N/A")
@@ -46,10 +59,24 @@ def report_generation_agent(state: State):
     else:
         largest_loss_contributor = "N/A"
 
+    if coverage_report:
+        data_coverage = (
+            f"{coverage_report['assets_covered']}/{coverage_report['assets_total']} assets "
+            f"({coverage_report['missing_exposure_share']:.2%} of exposure excluded)"
+        )
+        missing_assets = ", ".join(coverage_report["missing_assets"]) or "None"
+    else:
+        data_coverage = "N/A"
+        missing_assets = "N/A"
+
     if routing_decision == "CLEAR":
         validation_status = "Systemically Approved"
         compliance_status = "Within Limits"
         compliance_color = colors.green
+    elif routing_decision == "BREACH" and review_decision:
+        validation_status = "Manually Approved" if review_decision.get("approved") else "Rejected"
+        compliance_status = "BREACH  Limit Exceeded"
+        compliance_color = colors.red
     elif routing_decision == "BREACH":
         validation_status = "Manual Review Required"
         compliance_status = "BREACH  Limit Exceeded"
@@ -59,8 +86,11 @@ def report_generation_agent(state: State):
         compliance_status = "Unknown"
         compliance_color = colors.orange
 
-    report_id = f"RGA-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-    report_path = os.path.join(REPORTS_DIR, f"{report_id}.pdf")
+    generated_at = datetime.now()
+    report_id = state.get("report_id") or new_report_id(generated_at)
+    reports_dir = state.get("reports_dir", REPORTS_DIR)
+    os.makedirs(reports_dir, exist_ok=True)
+    report_path = os.path.join(reports_dir, f"{report_id}.pdf")
 
     doc = SimpleDocTemplate(report_path, pagesize=A4, leftMargin=0.75*inch, rightMargin=0.75*inch)
     styles = getSampleStyleSheet()
@@ -69,13 +99,13 @@ def report_generation_agent(state: State):
     story.append(Paragraph("<b>Daily Portfolio Risk Summary</b>", styles["Title"]))
     story.append(Spacer(1, 0.3 * inch))
     story.append(Paragraph(f"<i>Risk Report ID:</i> {report_id}", styles["Normal"]))
-    story.append(Paragraph(f"<i>Date Generated:</i> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles["Normal"]))
+    story.append(Paragraph(f"<i>Date Generated:</i> {generated_at.strftime('%Y-%m-%d %H:%M:%S')}", styles["Normal"]))
     story.append(Spacer(1, 0.2 * inch))
 
     story.append(Paragraph("<b>I. Key Risk Metrics</b>", styles["Heading2"]))
     key_metrics = [
         ["VaR (99%, 1-Day)", f"${var_99:,.2f}"],
-        ["VaR Compliance Threshold", "$550,000.00"],
+        ["VaR Compliance Threshold", f"${var_threshold:,.2f}"],
         ["Compliance Status", compliance_status],
     ]
     t1 = Table(key_metrics, hAlign="LEFT", colWidths=[220, 220])
@@ -92,7 +122,9 @@ def report_generation_agent(state: State):
         ["Total Portfolio Value (V0)", f"${total_value:,.2f}"],
         ["Calculation Method", "Historical Simulation (10-Day Window)"],
         ["MCP Tool Audit ID", audit_id],
-        ["Orchestration Route", f"RARA → RGA → {'Manual Review' if routing_decision=='BREACH' else 'END'}"],
+        ["Data Coverage", data_coverage],
+        ["Assets Without History", missing_assets],
+        ["Orchestration Route", f"RARA → {'HITL → ' if routing_decision=='BREACH' else ''}RGA → END"],
     ]
     t2 = Table(audit_data, hAlign="LEFT", colWidths=[220, 300])
     t2.setStyle(TableStyle([
@@ -107,7 +139,7 @@ def report_generation_agent(state: State):
             ["Breach Type", "Value-at-Risk Limit Exceeded"],
             ["Breach Detected On", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
             ["Action Required", "Risk Manager review and mitigation plan submission"],
-            ["Status", "Pending Manual Approval"],
+            ["Status", validation_log if review_decision else "Pending Manual Approval"],
         ]
         t3 = Table(breach_details, hAlign="LEFT", colWidths=[220, 300])
         t3.setStyle(TableStyle([
@@ -130,6 +162,11 @@ def report_generation_agent(state: State):
 
     doc.build(story)
     print(f"[RGA] Report successfully generated at: {report_path}")
+
+    timings = {**state.get("timings", {}), "RGA": round(time.perf_counter() - started, 4)}
+    state["report_id"] = report_id
     state["report_path"] = report_path
+    state["timings"] = timings
+    record_run(run_record(state, OK, report_path))
     return state
 
@@ -1,6 +1,7 @@
 import os
 import json
 from typing import TypedDict
+from run_index import new_report_id
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -8,9 +9,12 @@ RISK_CONFIG_PATH = os.path.join(DATA_DIR, "risk_config.json")
 
 
 class State(TypedDict, total=False):
+    risk_config_path: str
     calculated_metrics: dict
+    var_threshold: float
     routing_decision: str
     validation_log: str
+    report_id: str
 
 
 def risk_assessment_node(state: State):
@@ -19,14 +23,18 @@ def risk_assessment_node(state: State):
     """
     print("\n[RARA] Starting Risk Assessment...")
 
-    if not os.path.exists(RISK_CONFIG_PATH):
-        raise FileNotFoundError(f"Risk config file not found: {RISK_CONFIG_PATH}")
+    risk_config_path = state.get("risk_config_path", RISK_CONFIG_PATH)
+    if not os.path.exists(risk_config_path):
+        raise FileNotFoundError(f"Risk config file not found: {risk_config_path}")
 
-    with open(RISK_CONFIG_PATH, "r") as f:
+    with open(risk_config_path, "r") as f:
         risk_config = json.load(f)
 
     var_threshold = risk_config.get("VaR_threshold_usd", 550000.0)
     calculated_var = state["calculated_metrics"].get("VaR_99")
+    state["var_threshold"] = var_threshold
+    # Assigned here so a run paused for review is indexed under the same ID its report gets.
+    state["report_id"] = state.get("report_id") or new_report_id()
 
     print(f"[RARA] Calculated VaR99: ${calculated_var:,.2f}")
     print(f"[RARA] Config Threshold: ${var_threshold:,.2f}")
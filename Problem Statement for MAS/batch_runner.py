@@ -0,0 +1,236 @@
+"""
+End-of-day batch runner.
+
+Runs every portfolio/market/config set in a data directory (portfolio_dump_<X>.json
++ market_closes_<X>.json, with risk_config_<X>.json or risk_config.json) or a JSON
+manifest through the risk graph concurrently, writes the reports plus a
+summary.json, and prints throughput, per-stage latency percentiles and failures.
+
+    python batch_runner.py --data-dir data --workers 4
+    python batch_runner.py --manifest nightly.json --output-dir reports/nightly
+
+Manifest format: [{"name": "B", "portfolio": "...", "market_closes": "...", "risk_config": "..."}]
+Relative manifest paths are resolved against the manifest's directory. "name" defaults
+to the entry's position and "risk_config" to risk_config.json next to the portfolio.
+Set names key the checkpoint thread and report folder, so they must be unique.
+"""
+import argparse
+import asyncio
+import glob
+import json
+import math
+import os
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from main import graph_builder
+from checkpointing import open_checkpointer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+REPORTS_DIR = os.path.join(BASE_DIR, "reports")
+
+STAGES = ["DIA", "FCA", "RARA", "HITL", "RGA"]
+PERCENTILES = [50, 95, 99]
+
+
+def discover_sets(data_dir: str) -> list:
+    """Pairs portfolio_dump_<X>.json with market_closes_<X>.json in a directory."""
+    sets = []
+    for portfolio_path in sorted(glob.glob(os.path.join(data_dir, "portfolio_dump_*.json"))):
+        name = os.path.basename(portfolio_path)[len("portfolio_dump_"):-len(".json")]
+        market_closes_path = os.path.join(data_dir, f"market_closes_{name}.json")
+        if not os.path.exists(market_closes_path):
+            print(f"[BATCH] Skipping {name}: no market_closes_{name}.json")
+            continue
+        risk_config_path = os.path.join(data_dir, f"risk_config_{name}.json")
+        if not os.path.exists(risk_config_path):
+            risk_config_path = os.path.join(data_dir, "risk_config.json")
+        sets.append({
+            "name": name,
+            "portfolio": portfolio_path,
+            "market_closes": market_closes_path,
+            "risk_config": risk_config_path,
+        })
+    return sets
+
+
+def load_manifest(manifest_path: str) -> list:
+    with open(manifest_path, "r") as f:
+        entries = json.load(f)
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    sets = []
+    for i, entry in enumerate(entries):
+        missing = [key for key in ("portfolio", "market_closes") if key not in entry]
+        if missing:
+            raise ValueError(f"Manifest entry {i} is missing {', '.join(missing)}")
+        portfolio_path = os.path.join(manifest_dir, entry["portfolio"])
+        if "risk_config" in entry:
+            risk_config_path = os.path.join(manifest_dir, entry["risk_config"])
+        else:
+            risk_config_path = os.path.join(os.path.dirname(portfolio_path), "risk_config.json")
+            if not os.path.exists(risk_config_path):
+                raise ValueError(f"Manifest entry {i} has no risk_config and {risk_config_path} does not exist")
+        sets.append({
+            "name": str(entry.get("name", i)),
+            "portfolio": portfolio_path,
+            "market_closes": os.path.join(manifest_dir, entry["market_closes"]),
+            "risk_config": risk_config_path,
+        })
+    check_unique_names(sets)
+    return sets
+
+
+def check_unique_names(sets: list):
+    """Set names key checkpoint threads and report folders; duplicates would share them."""
+    counts = Counter(s["name"] for s in sets)
+    duplicates = sorted(name for name, count in counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate portfolio set names: {', '.join(duplicates)}")
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+async def run_set(graph, portfolio_set: dict, run_id: str, output_dir: str, semaphore: asyncio.Semaphore) -> dict:
+    """Streams one set through the graph, timing each node as its update arrives."""
+    thread_id = f"{run_id}-{portfolio_set['name']}"
+    config = {"configurable": {"thread_id": thread_id}}
+    result = {"name": portfolio_set["name"], "thread_id": thread_id, "stage_seconds": {}}
+
+    async with semaphore:
+        started = last = time.perf_counter()
+        try:
+            async for update in graph.astream(
+                {
+                    "desk": portfolio_set["name"],
+                    "portfolio_path": portfolio_set["portfolio"],
+                    "market_closes_path": portfolio_set["market_closes"],
+                    "risk_config_path": portfolio_set["risk_config"],
+                    "reports_dir": os.path.join(output_dir, portfolio_set["name"]),
+                },
+                config,
+                stream_mode="updates",
+            ):
+                now = time.perf_counter()
+                for node in update:
+                    stage = "HITL" if node == "__interrupt__" else node
+                    result["stage_seconds"][stage] = result["stage_seconds"].get(stage, 0.0) + now - last
+                last = now
+
+            snapshot = await graph.aget_state(config)
+            state = snapshot.values
+            metrics = state.get("calculated_metrics", {})
+            result.update({
+                "status": "PENDING_REVIEW" if snapshot.next else "OK",
+                "routing_decision": state.get("routing_decision"),
+                "VaR_99": metrics.get("VaR_99"),
+                "mcp_audit_id": metrics.get("mcp_audit_id"),
+                "missing_assets": metrics.get("coverage", {}).get("missing_assets", []),
+                "report_id": state.get("report_id"),
+                "report_path": state.get("report_path"),
+            })
+        except Exception as e:
+            result.update({"status": "FAILED", "error": f"{type(e).__name__}: {e}"})
+        result["total_seconds"] = time.perf_counter() - started
+
+    print(f"[BATCH] {portfolio_set['name']}: {result['status']} in {result['total_seconds']:.2f}s")
+    return result
+
+
+def summarize(results: list, wall_seconds: float) -> dict:
+    latency = {}
+    for stage in STAGES + ["total"]:
+        samples = [
+            r["total_seconds"] if stage == "total" else r["stage_seconds"][stage]
+            for r in results
+            if stage == "total" or stage in r["stage_seconds"]
+        ]
+        if samples:
+            latency[stage] = {f"p{p}": round(percentile(samples, p), 4) for p in PERCENTILES}
+
+    completed = [r for r in results if r["status"] != "FAILED"]
+    return {
+        "portfolios": len(results),
+        "completed": len(completed),
+        "pending_review": sum(r["status"] == "PENDING_REVIEW" for r in results),
+        "failed": len(results) - len(completed),
+        "wall_seconds": round(wall_seconds, 4),
+        "throughput_per_sec": round(len(completed) / wall_seconds, 4) if wall_seconds else 0.0,
+        "latency_seconds": latency,
+    }
+
+
+def print_summary(summary: dict, results: list):
+    print("\n[BATCH] Run summary")
+    print(f"  Portfolios: {summary['portfolios']}  Completed: {summary['completed']}  "
+          f"Pending review: {summary['pending_review']}  Failed: {summary['failed']}")
+    print(f"  Throughput: {summary['throughput_per_sec']:.2f} portfolios/sec "
+          f"({summary['wall_seconds']:.2f}s wall)")
+    print(f"  {'Stage':<6}" + "".join(f"{f'p{p}':>10}" for p in PERCENTILES))
+    for stage, pcts in summary["latency_seconds"].items():
+        print(f"  {stage:<6}" + "".join(f"{pcts[f'p{p}']:>9.3f}s" for p in PERCENTILES))
+    for r in results:
+        if r["status"] == "FAILED":
+            print(f"  FAILED {r['name']}: {r['error']}")
+        elif r["status"] == "PENDING_REVIEW":
+            print(f"  PENDING_REVIEW {r['name']}: python main.py --resume {r['thread_id']} --approve|--reject")
+
+
+async def run_batch(sets: list, workers: int, output_dir: str) -> dict:
+    check_unique_names(sets)
+    run_id = f"batch-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    output_dir = os.path.join(output_dir, run_id)
+    os.makedirs(output_dir, exist_ok=True)
+    semaphore = asyncio.Semaphore(workers)
+
+    async with open_checkpointer() as checkpointer:
+        graph = graph_builder.compile(checkpointer=checkpointer)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run_set(graph, s, run_id, output_dir, semaphore) for s in sets))
+        wall_seconds = time.perf_counter() - started
+
+    summary = {"run_id": run_id, **summarize(results, wall_seconds), "results": results}
+    summary_path = os.path.join(output_dir, "summary.json")
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print_summary(summary, results)
+    print(f"\n[BATCH] Summary written to: {summary_path}")
+    return summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run portfolio sets through the risk workflow in batch.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--data-dir", default=DATA_DIR, help="Directory of portfolio_dump_<X>/market_closes_<X> pairs.")
+    source.add_argument("--manifest", help="JSON manifest listing portfolio/market_closes/risk_config sets.")
+    parser.add_argument("--workers", type=int, default=4, help="Maximum sets run concurrently.")
+    parser.add_argument("--output-dir", default=REPORTS_DIR, help="Where the batch report folder is written.")
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+    try:
+        sets = load_manifest(args.manifest) if args.manifest else discover_sets(args.data_dir)
+    except ValueError as e:
+        raise SystemExit(f"[BATCH] {e}")
+    if not sets:
+        raise SystemExit("[BATCH] No portfolio sets found")
+
+    summary = asyncio.run(run_batch(sets, args.workers, args.output_dir))
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import zlib
+from contextlib import asynccontextmanager
+
+import aiosqlite
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_DB_PATH = os.path.join(BASE_DIR, "checkpoints.sqlite")
+
+COMPRESS_MIN_BYTES = 1024
+ZLIB_SUFFIX = "+zlib"
+
+
+class CompactSerializer(JsonPlusSerializer):
+    """
+    msgpack checkpoint serializer that zlib-compresses large payloads, so
+    states carrying full return histories stay cheap to persist.
+    """
+
+    def dumps_typed(self, obj):
+        type_, data = super().dumps_typed(obj)
+        if len(data) >= COMPRESS_MIN_BYTES:
+            return type_ + ZLIB_SUFFIX, zlib.compress(data)
+        return type_, data
+
+    def loads_typed(self, data):
+        type_, payload = data
+        if type_.endswith(ZLIB_SUFFIX):
+            return super().loads_typed((type_[: -len(ZLIB_SUFFIX)], zlib.decompress(payload)))
+        return super().loads_typed(data)
+
+
+@asynccontextmanager
+async def open_checkpointer(db_path: str = CHECKPOINT_DB_PATH):
+    """Opens the local SQLite checkpoint store used to pause and resume runs."""
+    async with aiosqlite.connect(db_path) as conn:
+        yield AsyncSqliteSaver(conn, serde=CompactSerializer())
@@ -1,24 +1,62 @@
+import argparse
+import inspect
 import json
 import asyncio
+import time
+import uuid
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import Command
 from agents.data_ingestion_agent import data_ingestion_node
 from agents.formulaic_calc_agent import formulaic_calc_agent
 from agents.risk_assessment_agent import risk_assessment_node
+from agents.human_review_agent import human_review_node
 from agents.report_generation_agent import report_generation_agent
+from checkpointing import open_checkpointer
 from typing import TypedDict, Annotated
 
 class State(TypedDict, total=False):
+    desk: str
+    portfolio_path: str
+    market_closes_path: str
+    risk_config_path: str
+    reports_dir: str
     clean_portfolio_data: list
     hist_returns: dict
+    inputs_hash: str
     calculated_metrics: dict
+    var_threshold: float
     routing_decision: str
     validation_log: str
+    review_decision: dict
+    timings: dict
+    report_id: str
+    report_path: str
+
+
+def timed(name, node):
+    """Wraps a node so its wall time is recorded under state["timings"][name]."""
+    def record(state, started):
+        state["timings"] = {**state.get("timings", {}), name: round(time.perf_counter() - started, 4)}
+        return state
+
+    if inspect.iscoroutinefunction(node):
+        async def run(state):
+            started = time.perf_counter()
+            return record(await node(state), started)
+    else:
+        def run(state):
+            started = time.perf_counter()
+            return record(node(state), started)
+    return run
+
 
 graph_builder = StateGraph(state_schema=State)
 
-graph_builder.add_node("DIA", data_ingestion_node)
-graph_builder.add_node("FCA", formulaic_calc_agent)
-graph_builder.add_node("RARA", risk_assessment_node)
+graph_builder.add_node("DIA", timed("DIA", data_ingestion_node))
+graph_builder.add_node("FCA", timed("FCA", formulaic_calc_agent))
+graph_builder.add_node("RARA", timed("RARA", risk_assessment_node))
+graph_builder.add_node("HITL", timed("HITL", human_review_node))
+# RGA times itself so its own duration lands in the run index record.
 graph_builder.add_node("RGA", report_generation_agent)
 
 graph_builder.add_edge(START, "DIA")
@@ -28,16 +66,52 @@ graph_builder.add_conditional_edges(
     "RARA",
     lambda state: state["routing_decision"],
     {
-        "CLEAR": "RGA",   
-        "BREACH": END     
+        "CLEAR": "RGA",
+        "BREACH": "HITL"
     }
 )
+graph_builder.add_edge("HITL", "RGA")
 graph_builder.add_edge("RGA", END)
 
-graph = graph_builder.compile()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the daily risk assessment workflow.")
+    parser.add_argument("--desk", default="default", help="Desk name recorded in the run index.")
+    parser.add_argument("--resume", metavar="THREAD_ID", help="Resume a run paused for BREACH review.")
+    decision = parser.add_mutually_exclusive_group()
+    decision.add_argument("--approve", action="store_true", help="Approve the breach and generate the report.")
+    decision.add_argument("--reject", action="store_true", help="Reject the breach and generate the report.")
+    parser.add_argument("--reviewer", default="", help="Name of the reviewing Risk Manager.")
+    parser.add_argument("--notes", default="", help="Review notes recorded in the report.")
+    args = parser.parse_args()
+    if args.resume and not (args.approve or args.reject):
+        parser.error("--resume requires --approve or --reject")
+    return args
+
 
 async def main():
-    final_state = await graph.ainvoke({})
+    args = parse_args()
+    thread_id = args.resume or str(uuid.uuid4())
+    config = {"configurable": {"thread_id": thread_id}}
+
+    async with open_checkpointer() as checkpointer:
+        graph = graph_builder.compile(checkpointer=checkpointer)
+
+        if args.resume:
+            snapshot = await graph.aget_state(config)
+            if "HITL" not in snapshot.next:
+                raise SystemExit(f"No run awaiting review for thread {thread_id}")
+            final_state = await graph.ainvoke(
+                Command(resume={"approved": args.approve, "reviewer": args.reviewer, "notes": args.notes}),
+                config,
+            )
+        else:
+            final_state = await graph.ainvoke({"desk": args.desk}, config)
+
+    if final_state.pop("__interrupt__", None):
+        print(f"\n Run paused for BREACH review (thread {thread_id}). Resume with:")
+        print(f"   python main.py --resume {thread_id} --approve|--reject --reviewer NAME")
+
     print("\n Final Computed State:")
     print(json.dumps(final_state, indent=2))
 
@@ -0,0 +1,158 @@
+import json
+import os
+import sqlite3
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RUN_INDEX_PATH = os.path.join(BASE_DIR, "reports", "run_index.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    report_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    desk TEXT NOT NULL,
+    inputs_hash TEXT,
+    var_99 REAL,
+    var_threshold REAL,
+    routing_decision TEXT,
+    validation_log TEXT,
+    mcp_audit_id TEXT,
+    timings TEXT,
+    report_path TEXT,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_desk_created ON runs (desk, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs (created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_inputs_hash ON runs (inputs_hash);
+"""
+
+COLUMNS = [
+    "report_id", "created_at", "desk", "inputs_hash", "var_99", "var_threshold",
+    "routing_decision", "validation_log", "mcp_audit_id", "timings", "report_path", "status",
+]
+UPSERT_COLUMNS = ", ".join(
+    f"{column} = excluded.{column}" for column in COLUMNS if column not in ("report_id", "created_at")
+)
+
+# Run statuses: a BREACH run is indexed as PENDING_REVIEW when it pauses for
+# human review and updated in place to OK once its report is generated.
+PENDING_REVIEW = "PENDING_REVIEW"
+OK = "OK"
+
+
+def new_report_id(at: datetime | None = None) -> str:
+    """Collision-free report ID; also the run's key in the index."""
+    at = at or datetime.now()
+    return f"RGA-{at.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def run_record(state: dict, status: str, report_path: str | None = None) -> dict:
+    """Index record for a graph run from its state."""
+    metrics = state.get("calculated_metrics", {})
+    return {
+        "report_id": state["report_id"],
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "desk": state.get("desk", "default"),
+        "inputs_hash": state.get("inputs_hash"),
+        "var_99": metrics.get("VaR_99"),
+        "var_threshold": state.get("var_threshold"),
+        "routing_decision": state.get("routing_decision"),
+        "validation_log": state.get("validation_log"),
+        "mcp_audit_id": metrics.get("mcp_audit_id"),
+        "timings": state.get("timings", {}),
+        "report_path": report_path,
+        "status": status,
+    }
+
+
+def connect(db_path: str = RUN_INDEX_PATH) -> sqlite3.Connection:
+    """Opens the run index, creating it on first use. WAL lets concurrent runs write safely."""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    if "status" not in {row[1] for row in conn.execute("PRAGMA table_info(runs)")}:
+        conn.execute("ALTER TABLE runs ADD COLUMN status TEXT")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _connect_readonly(db_path: str) -> sqlite3.Connection:
+    """Read-only connection for history queries: no pragma or schema script per call."""
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, timeout=30)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def record_run(record: dict, db_path: str = RUN_INDEX_PATH):
+    """
+    Writes one run record; timings is stored as JSON. Recording an existing
+    report_id again updates that row in place and keeps its created_at.
+    """
+    row = {column: record.get(column) for column in COLUMNS}
+    row["timings"] = json.dumps(record.get("timings") or {})
+    conn = connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                f"INSERT INTO runs ({', '.join(COLUMNS)}) VALUES ({', '.join(':' + c for c in COLUMNS)}) "
+                f"ON CONFLICT(report_id) DO UPDATE SET {UPSERT_COLUMNS}",
+                row,
+            )
+    finally:
+        conn.close()
+
+
+def query_runs(
+    desk: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    routing_decision: str | None = None,
+    status: str | None = None,
+    limit: int = 100,
+    db_path: str = RUN_INDEX_PATH,
+) -> list:
+    """
+    Newest-first run history. since/until are ISO timestamps or dates compared
+    against created_at (until is exclusive).
+    """
+    if not os.path.exists(db_path):
+        return []
+
+    clauses, params = [], []
+    for column, op, value in (
+        ("desk", "=", desk),
+        ("created_at", ">=", since),
+        ("created_at", "<", until),
+        ("routing_decision", "=", routing_decision),
+        ("status", "=", status),
+    ):
+        if value is not None:
+            clauses.append(f"{column} {op} ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    conn = _connect_readonly(db_path)
+    try:
+        rows = conn.execute(
+            f"SELECT * FROM runs {where} ORDER BY created_at DESC LIMIT ?", (*params, limit)
+        ).fetchall()
+    finally:
+        conn.close()
+    # Rows written before the status column existed were only recorded by RGA.
+    return [
+        {**dict(row), "timings": json.loads(row["timings"] or "{}"), "status": dict(row).get("status") or OK}
+        for row in rows
+    ]
+
+
+def list_desks(db_path: str = RUN_INDEX_PATH) -> list:
+    if not os.path.exists(db_path):
+        return []
+    conn = _connect_readonly(db_path)
+    try:
+        return [row["desk"] for row in conn.execute("SELECT DISTINCT desk FROM runs ORDER BY desk")]
+    finally:
+        conn.close()
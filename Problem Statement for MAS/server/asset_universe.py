@@ -0,0 +1,53 @@
+import numpy as np
+
+
+class AssetUniverse:
+    """
+    Interns the asset IDs of a market-closes dump into integer positions of an
+    asset x day return matrix, so portfolio rows are joined to return columns
+    once per run instead of by string lookup inside the day loop.
+    """
+
+    def __init__(self, hist_returns: dict):
+        self.asset_ids = list(hist_returns)
+        self.index = {asset_id: i for i, asset_id in enumerate(self.asset_ids)}
+        self.returns = np.asarray([hist_returns[a] for a in self.asset_ids], dtype=float)
+
+    @property
+    def num_days(self) -> int:
+        return self.returns.shape[1] if self.asset_ids else 0
+
+    def positions(self, asset_ids) -> np.ndarray:
+        """Integer row position per asset ID, -1 where the asset has no history."""
+        return np.array([self.index.get(a, -1) for a in asset_ids], dtype=np.intp)
+
+    def join(self, portfolio: list):
+        """
+        Joins portfolio rows to return rows. Returns (positions, exposures),
+        where exposures are Quantity x Market Price in USD.
+        """
+        positions = self.positions(item["Asset ID"] for item in portfolio)
+        exposures = np.array(
+            [item["Quantity"] * item["Market Price (USD)"] for item in portfolio], dtype=float
+        )
+        return positions, exposures
+
+    def pnl(self, positions: np.ndarray, exposures: np.ndarray) -> np.ndarray:
+        """Daily P&L vector of the joined portfolio; uncovered rows contribute nothing."""
+        covered = positions >= 0
+        if not covered.any():
+            return np.zeros(self.num_days)
+        return exposures[covered] @ self.returns[positions[covered]]
+
+    def coverage_report(self, portfolio: list, positions: np.ndarray, exposures: np.ndarray) -> dict:
+        """Missing assets and the share of gross exposure left out of the VaR."""
+        missing = positions < 0
+        gross = float(np.abs(exposures).sum())
+        missing_exposure = float(np.abs(exposures[missing]).sum())
+        return {
+            "assets_total": len(portfolio),
+            "assets_covered": int((~missing).sum()),
+            "missing_assets": [item["Asset ID"] for item, m in zip(portfolio, missing) if m],
+            "missing_exposure_usd": round(missing_exposure, 2),
+            "missing_exposure_share": round(missing_exposure / gross, 6) if gross else 0.0,
+        }
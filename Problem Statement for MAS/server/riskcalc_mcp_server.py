@@ -1,33 +1,56 @@
 from mcp.server.fastmcp import FastMCP
+from collections import OrderedDict
+import hashlib
+import json
 import uuid
+import numpy as np
+try:
+    from server.asset_universe import AssetUniverse
+except ModuleNotFoundError:
+    # Launched as a script (python server/riskcalc_mcp_server.py): server/ is on sys.path.
+    from asset_universe import AssetUniverse
 
 mcp = FastMCP("RiskCalc MCP Server")
-@mcp.tool()
-async def compute_historical_var(portfolio: list, hist_returns: dict, conf_level: float = 0.99) -> dict:
+
+BASE_CACHE_SIZE = 32
+_base_cache = OrderedDict()
+
+
+def _base_key(portfolio: list, hist_returns: dict) -> str:
+    payload = json.dumps([portfolio, hist_returns], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _build_base(portfolio: list, hist_returns: dict) -> dict:
     """
-    Computes Historical Value at Risk (VaR) for the given portfolio using
-    10 days of historical returns.
+    Builds the asset universe and the base portfolio P&L vector that every
+    what-if trade is layered on top of.
     """
+    universe = AssetUniverse(hist_returns)
+    positions, exposures = universe.join(portfolio)
+    return {"universe": universe, "base_pnl": universe.pnl(positions, exposures)}
 
-    pnl_distribution = []
-    num_days = len(next(iter(hist_returns.values())))
 
-    for day_index in range(num_days):
-        daily_pnl = 0.0
-        for asset in portfolio:
-            asset_id = asset["Asset ID"]
-            qty = asset["Quantity"]
-            price = asset["Market Price (USD)"]
+def _historical_var(pnl: np.ndarray, conf_level: float) -> np.ndarray:
+    """VaR along the last axis, using the same order statistic as compute_historical_var."""
+    var_index = int((1 - conf_level) * pnl.shape[-1])
+    return np.abs(np.partition(pnl, var_index, axis=-1)[..., var_index])
 
-            if asset_id not in hist_returns:
-                print(f"[Warning] No historical returns for asset: {asset_id}")
-                continue
 
-            daily_return = hist_returns[asset_id][day_index]
-            daily_pnl += qty * price * daily_return
+@mcp.tool()
+async def compute_historical_var(portfolio: list, hist_returns: dict, conf_level: float = 0.99) -> dict:
+    """
+    Computes Historical Value at Risk (VaR) for the given portfolio using
+    10 days of historical returns.
+    """
 
-        pnl_distribution.append(daily_pnl)
+    universe = AssetUniverse(hist_returns)
+    positions, exposures = universe.join(portfolio)
+    coverage = universe.coverage_report(portfolio, positions, exposures)
+    if coverage["missing_assets"]:
+        print(f"[Warning] No historical returns for assets: {', '.join(coverage['missing_assets'])}")
 
+    pnl_distribution = universe.pnl(positions, exposures).tolist()
     pnl_distribution.sort()
     var_index = int((1 - conf_level) * len(pnl_distribution))
     var_99 = abs(pnl_distribution[var_index])
@@ -35,6 +58,71 @@ async def compute_historical_var(portfolio: list, hist_returns: dict, conf_level
     return {
         "VaR_99": round(var_99, 2),
         "pnl_distribution": [round(x, 2) for x in pnl_distribution],
+        "coverage": coverage,
+        "mcp_audit_id": str(uuid.uuid4()),
+    }
+
+
+@mcp.tool()
+async def compute_whatif_var(
+    trades: list,
+    portfolio: list | None = None,
+    hist_returns: dict | None = None,
+    base_id: str | None = None,
+    conf_level: float = 0.99,
+) -> dict:
+    """
+    Pre-trade what-if VaR for a batch of candidate trades.
+
+    The base portfolio P&L vector is cached (keyed by base_id) so repeated
+    batches only pay O(days) per trade: each trade adds exposure x return
+    column to the cached vector. Pass portfolio + hist_returns on the first
+    call and reuse the returned base_id afterwards.
+    Each trade is {"Asset ID", "Quantity", "Market Price (USD)"}; Quantity is
+    the signed position change.
+    """
+
+    if portfolio is not None and hist_returns is not None:
+        base_id = _base_key(portfolio, hist_returns)
+        if base_id not in _base_cache:
+            _base_cache[base_id] = _build_base(portfolio, hist_returns)
+            if len(_base_cache) > BASE_CACHE_SIZE:
+                _base_cache.popitem(last=False)
+    if base_id not in _base_cache:
+        raise ValueError(f"Unknown base_id {base_id!r}; pass portfolio and hist_returns to build it.")
+
+    _base_cache.move_to_end(base_id)
+    base = _base_cache[base_id]
+    base_pnl = base["base_pnl"]
+    base_var = float(_historical_var(base_pnl, conf_level))
+
+    universe = base["universe"]
+    cols = universe.positions(t["Asset ID"] for t in trades)
+    exposures = np.array(
+        [float(t["Quantity"]) * float(t["Market Price (USD)"]) for t in trades], dtype=float
+    )
+    has_history = cols >= 0
+    for trade, ok in zip(trades, has_history):
+        if not ok:
+            print(f"[Warning] No historical returns for asset: {trade['Asset ID']}")
+
+    trade_returns = universe.returns[np.where(has_history, cols, 0)] * has_history[:, None]
+    whatif_pnl = base_pnl + exposures[:, None] * trade_returns
+    whatif_var = _historical_var(whatif_pnl, conf_level)
+    var_delta = whatif_var - base_var
+
+    return {
+        "base_id": base_id,
+        "base_VaR_99": round(base_var, 2),
+        "whatif": [
+            {
+                "Asset ID": t["Asset ID"],
+                "VaR_99": round(float(v), 2),
+                "VaR_delta": round(float(d), 2),
+                "has_history": bool(ok),
+            }
+            for t, v, d, ok in zip(trades, whatif_var, var_delta, has_history)
+        ],
         "mcp_audit_id": str(uuid.uuid4()),
     }
 
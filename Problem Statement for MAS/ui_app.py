@@ -1,9 +1,11 @@
 import streamlit as st
+import hashlib
 import json
 import asyncio
 import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import BytesIO
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
@@ -11,6 +13,8 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet
 from collections import defaultdict
+from server.asset_universe import AssetUniverse
+from run_index import OK, new_report_id, query_runs, list_desks, record_run
 
 st.set_page_config(page_title="MAS Risk Assessment", layout="centered")
 
@@ -53,27 +57,15 @@ confidence_level = st.slider(
     step=0.01,
     format="%.2f"
 )
+desk = st.text_input("Desk", value="default")
 
 def compute_historical_var(portfolio, hist_returns, conf_level=0.99):
     """Computes Historical Value at Risk (VaR)"""
-    pnl_distribution = []
-    num_days = len(next(iter(hist_returns.values())))
-    
-    for day_index in range(num_days):
-        daily_pnl = 0.0
-        for asset in portfolio:
-            asset_id = asset["Asset ID"]
-            qty = asset["Quantity"]
-            price = asset["Market Price (USD)"]
-            
-            if asset_id not in hist_returns:
-                continue
-                
-            daily_return = hist_returns[asset_id][day_index]
-            daily_pnl += qty * price * daily_return
-        
-        pnl_distribution.append(daily_pnl)
-    
+    universe = AssetUniverse(hist_returns)
+    positions, exposures = universe.join(portfolio)
+    coverage = universe.coverage_report(portfolio, positions, exposures)
+
+    pnl_distribution = universe.pnl(positions, exposures).tolist()
     pnl_distribution.sort()
     var_index = int((1 - conf_level) * len(pnl_distribution))
     var_99 = abs(pnl_distribution[var_index])
@@ -81,15 +73,18 @@ def compute_historical_var(portfolio, hist_returns, conf_level=0.99):
     return {
         "VaR_99": round(var_99, 2),
         "pnl_distribution": [round(x, 2) for x in pnl_distribution],
+        "coverage": coverage,
         "mcp_audit_id": str(uuid.uuid4()),
     }
 
 def generate_pdf_report(state):
-    """Generate PDF report in memory"""
+    """Generate PDF report in memory and record the run in the run index"""
+    started = time.perf_counter()
     clean_data = state.get("clean_portfolio_data", [])
     calculated_metrics = state.get("calculated_metrics", {})
     routing_decision = state.get("routing_decision", "UNKNOWN")
     validation_log = state.get("validation_log", "N/A")
+    coverage_report = calculated_metrics.get("coverage", {})
     
     var_99 = calculated_metrics.get("VaR_99", 0.0)
     audit_id = calculated_metrics.get("mcp_audit_id", "N/A")
@@ -102,6 +97,16 @@ def generate_pdf_report(state):
     
     largest_sector = max(sector_values, key=sector_values.get) if sector_values else "N/A"
     largest_exposure = f"{largest_sector} (${sector_values.get(largest_sector, 0):,.2f})" if clean_data else "N/A"
+
+    if coverage_report:
+        data_coverage = (
+            f"{coverage_report['assets_covered']}/{coverage_report['assets_total']} assets "
+            f"({coverage_report['missing_exposure_share']:.2%} of exposure excluded)"
+        )
+        missing_assets = ", ".join(coverage_report["missing_assets"]) or "None"
+    else:
+        data_coverage = "N/A"
+        missing_assets = "N/A"
     
     if routing_decision == "CLEAR":
         validation_status = "Systemically Approved"
@@ -116,7 +121,8 @@ def generate_pdf_report(state):
         compliance_status = "Unknown"
         compliance_color = colors.orange
     
-    report_id = f"RGA-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    generated_at = datetime.now()
+    report_id = new_report_id(generated_at)
 
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, leftMargin=0.75*inch, rightMargin=0.75*inch)
@@ -126,7 +132,7 @@ def generate_pdf_report(state):
     story.append(Paragraph("<b>Daily Portfolio Risk Summary</b>", styles["Title"]))
     story.append(Spacer(1, 0.3 * inch))
     story.append(Paragraph(f"<i>Risk Report ID:</i> {report_id}", styles["Normal"]))
-    story.append(Paragraph(f"<i>Date Generated:</i> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles["Normal"]))
+    story.append(Paragraph(f"<i>Date Generated:</i> {generated_at.strftime('%Y-%m-%d %H:%M:%S')}", styles["Normal"]))
     story.append(Spacer(1, 0.2 * inch))
     
     story.append(Paragraph("<b>I. Key Risk Metrics</b>", styles["Heading2"]))
@@ -149,6 +155,8 @@ def generate_pdf_report(state):
         ["Total Portfolio Value (V0)", f"${total_value:,.2f}"],
         ["Calculation Method", "Historical Simulation (10-Day Window)"],
         ["MCP Tool Audit ID", audit_id],
+        ["Data Coverage", data_coverage],
+        ["Assets Without History", missing_assets],
         ["Orchestration Route", f"DIA → FCA → RARA → RGA → {'Manual Review' if routing_decision=='BREACH' else 'END'}"],
     ]
     t2 = Table(audit_data, hAlign="LEFT", colWidths=[220, 300])
@@ -187,6 +195,22 @@ def generate_pdf_report(state):
     
     doc.build(story)
     buffer.seek(0)
+
+    # The PDF is only offered as a download, so there is no report_path to index.
+    record_run({
+        "report_id": report_id,
+        "created_at": generated_at.isoformat(timespec="seconds"),
+        "desk": state.get("desk", "default"),
+        "inputs_hash": state.get("inputs_hash"),
+        "var_99": var_99,
+        "var_threshold": state.get("var_threshold"),
+        "routing_decision": routing_decision,
+        "validation_log": validation_log,
+        "mcp_audit_id": audit_id,
+        "timings": {**state.get("timings", {}), "RGA": round(time.perf_counter() - started, 4)},
+        "report_path": None,
+        "status": OK,
+    })
     return buffer, report_id
 
 if st.button(" Run Risk Workflow", type="primary", disabled=not (portfolio_file and market_file and risk_config_file)):
@@ -197,6 +221,8 @@ if st.button(" Run Risk Workflow", type="primary", disabled=not (portfolio_file
             risk_config = json.load(risk_config_file)
             
            
+            timings = {}
+            stage_started = time.perf_counter()
             st.info(" [DIA] Data ingestion in progress...")
             clean_portfolio_data = [
                 {
@@ -209,13 +235,28 @@ if st.button(" Run Risk Workflow", type="primary", disabled=not (portfolio_file
                 for item in portfolio_data
             ]
            
+            inputs_hash = hashlib.sha256(
+                json.dumps([portfolio_data, market_data], sort_keys=True).encode()
+            ).hexdigest()
+            timings["DIA"] = round(time.perf_counter() - stage_started, 4)
+
+            stage_started = time.perf_counter()
             st.info("[FCA] Computing Value-at-Risk (VaR)...")
             calculated_metrics = compute_historical_var(
                 clean_portfolio_data,
                 market_data,
                 confidence_level
             )
+            coverage_report = calculated_metrics["coverage"]
+            if coverage_report["missing_assets"]:
+                st.warning(
+                    f"No historical returns for {', '.join(coverage_report['missing_assets'])} "
+                    f"({coverage_report['missing_exposure_share']:.2%} of gross exposure excluded from VaR)"
+                )
          
+            timings["FCA"] = round(time.perf_counter() - stage_started, 4)
+
+            stage_started = time.perf_counter()
             st.info("[RARA] Performing risk assessment...")
             var_threshold = risk_config.get("VaR_threshold_usd", 550000.0)
             calculated_var = calculated_metrics.get("VaR_99")
@@ -227,7 +268,12 @@ if st.button(" Run Risk Workflow", type="primary", disabled=not (portfolio_file
                 routing_decision = "CLEAR"
                 validation_log = "Auto Approved (No Breach)"
             
+            timings["RARA"] = round(time.perf_counter() - stage_started, 4)
+
             state = {
+                "desk": desk,
+                "inputs_hash": inputs_hash,
+                "timings": timings,
                 "clean_portfolio_data": clean_portfolio_data,
                 "calculated_metrics": calculated_metrics,
                 "routing_decision": routing_decision,
@@ -296,5 +342,40 @@ if st.button(" Run Risk Workflow", type="primary", disabled=not (portfolio_file
             st.error(f" Error during workflow execution: {str(e)}")
             st.exception(e)
 
+st.header(" Run History")
+history_col1, history_col2 = st.columns(2)
+
+with history_col1:
+    history_desk = st.selectbox("Desk", ["All"] + list_desks())
+
+with history_col2:
+    history_date = st.date_input("Run Date", value=None)
+
+history = query_runs(
+    desk=None if history_desk == "All" else history_desk,
+    since=history_date.isoformat() if history_date else None,
+    until=(history_date + timedelta(days=1)).isoformat() if history_date else None,
+)
+if history:
+    st.dataframe(
+        [
+            {
+                "Report ID": run["report_id"],
+                "Created": run["created_at"],
+                "Desk": run["desk"],
+                "VaR (99%)": run["var_99"],
+                "Threshold": run["var_threshold"],
+                "Decision": run["routing_decision"],
+                "Status": run["status"],
+                "Audit ID": run["mcp_audit_id"],
+                "Report": run["report_path"] or "Download only",
+            }
+            for run in history
+        ],
+        width="stretch",
+    )
+else:
+    st.info("No indexed runs for this selection yet.")
+
 st.markdown("---")
 st.caption("MAS Daily Risk Assessment System | Powered by Streamlit")
\ No newline at end of file